@@ -0,0 +1,305 @@
+import re
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Set
+
+import fitz
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from transformers import AutoTokenizer
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Stored next to the FAISS index. Bump it whenever chunking changes so that
+# indexes built by an older chunker are rebuilt instead of served.
+CHUNKER_VERSION = "3"
+
+# all-MiniLM-L6-v2 truncates inputs at 256 word pieces, so keep a small margin
+# for the [CLS]/[SEP] tokens the model adds itself
+MAX_CHUNK_TOKENS = 250
+
+# Configuration for heading detection from the PDF layout
+HEADING_MAX_WORDS = 15
+HEADING_SIZE_DELTA = 0.5
+BOLD_FLAG = 16
+
+# Statute structure: "CHAPTER II", "2. Definitions.—(1) In this Act...", "(2) The..."
+CHAPTER_PATTERN = re.compile(r"^CHAPTER\s+([IVXLC]+[A-Z]?)\b")
+SECTION_PATTERN = re.compile(r"^(\d+[A-Z]*)\.\s*\S")
+SUBSECTION_PATTERN = re.compile(r"^\((\d+[A-Z]?)\)\s*\S")
+INLINE_SUBSECTION_PATTERN = re.compile(r"—\s*\((\d+[A-Z]?)\)")
+CONTENTS_HEADING = "ARRANGEMENT OF SECTIONS"
+
+# Schedules and the Statement of Objects and Reasons follow the last section
+# ("1[2[THE FIRST SCHEDULE]]", "STATEMENT OF OBJECTS AND REASONS")
+BACK_MATTER_PATTERN = re.compile(r"^[\d\[\s]*(THE\s+(\w+\s+)?SCHEDULE|STATEMENT OF OBJECTS AND REASONS)\b")
+
+# Amendment notes at the foot of a page: "1. Subs. by Act 54 of 1994, s. 2..."
+FOOTNOTE_PATTERN = re.compile(r"^(\d+\.|\*)\s*\S")
+
+tokenizer = AutoTokenizer.from_pretrained(f"sentence-transformers/{EMBEDDING_MODEL}")
+
+# Fallback splitter for a single section that is larger than the token budget
+oversize_splitter = RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+    tokenizer,
+    chunk_size=MAX_CHUNK_TOKENS,
+    chunk_overlap=0
+)
+
+
+def count_tokens(text: str) -> int:
+    return len(tokenizer.encode(text, add_special_tokens=False))
+
+
+# Extract text lines with their font size and boldness from the page layout
+def _page_lines(page: fitz.Page) -> List[dict]:
+    lines = []
+    for block in page.get_text("dict")["blocks"]:
+        if block.get("type") != 0:
+            continue
+
+        for line in block["lines"]:
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+
+            size = max(span["size"] for span in spans)
+
+            # Leading superscript footnote markers ("1[(38A) ...") are dropped for
+            # structure matching but kept in the chunk text
+            body_spans = spans
+            while len(body_spans) > 1 and body_spans[0]["size"] < size - HEADING_SIZE_DELTA:
+                body_spans = body_spans[1:]
+
+            # Span boundaries are font changes within a line, not word breaks
+            text = " ".join("".join(span["text"] for span in spans).split())
+
+            # Running page numbers carry no content
+            if text.isdigit():
+                continue
+
+            lines.append({
+                "text": text,
+                "match_text": "".join(span["text"] for span in body_spans).strip().lstrip("["),
+                "size": round(size, 1),
+                "y": line["bbox"][1],
+                "bold": bool(body_spans[0]["flags"] & BOLD_FLAG),
+                "all_bold": all(span["flags"] & BOLD_FLAG for span in spans),
+            })
+    return lines
+
+
+# Most common font size is taken as the body text size. Some pages of an Act are
+# typeset smaller than the rest, so footnotes are judged against their own page
+# (capped at the document's body size for sparse pages such as the cover).
+def _body_font_size(pages: List[List[dict]]) -> float:
+    sizes = Counter(line["size"] for lines in pages for line in lines)
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def _is_layout_heading(line: dict, body_size: float) -> bool:
+    if len(line["text"].split()) > HEADING_MAX_WORDS:
+        return False
+    return line["all_bold"] or line["text"].isupper() or line["size"] > body_size + HEADING_SIZE_DELTA
+
+
+# Footnotes sit below the page's body text in a smaller size. They begin at the
+# first smaller line that is either numbered or below the last line of body text,
+# and run to the end of the page.
+def _footnote_lines(lines: List[dict], page_body_size: float) -> Set[int]:
+    body_ys = [line["y"] for line in lines if line["size"] >= page_body_size - HEADING_SIZE_DELTA]
+    last_body_y = max(body_ys, default=0.0)
+
+    footnotes = set()
+    for index, line in enumerate(lines):
+        if line["size"] >= page_body_size - HEADING_SIZE_DELTA:
+            continue
+
+        if footnotes or FOOTNOTE_PATTERN.match(line["text"]) or line["y"] > last_body_y:
+            footnotes.add(index)
+    return footnotes
+
+
+# Section headings are set at body size as "2. Definitions.—" and usually bold.
+# This rules out contents entries ("2.Definitions.") and amendment footnotes,
+# which share the numbering but not the layout.
+def _is_section_heading(line: dict, page_body_size: float) -> bool:
+    if line["size"] < page_body_size - HEADING_SIZE_DELTA:
+        return False
+    return line["bold"] or "—" in line["match_text"]
+
+
+# The "Arrangement of Sections" runs from its heading until the first page of the
+# Act body. Its short titles would only compete with the real sections in retrieval.
+def _contents_pages(pages: List[List[dict]], body_size: float) -> Set[int]:
+    contents = set()
+    in_contents = False
+
+    for page_num, lines in enumerate(pages):
+        if any(CONTENTS_HEADING in line["text"].upper() for line in lines):
+            in_contents = True
+
+        if in_contents:
+            page_body_size = min(_body_font_size([lines]), body_size)
+            has_section = any(
+                SECTION_PATTERN.match(line["match_text"]) and _is_section_heading(line, page_body_size)
+                for line in lines
+            )
+            if has_section:
+                in_contents = False
+            else:
+                contents.add(page_num)
+
+    return contents
+
+
+# Split a document into segments that each start at a heading, section or sub-section
+def _segment_document(doc: fitz.Document) -> List[dict]:
+    pages = [_page_lines(page) for page in doc]
+    body_size = _body_font_size(pages)
+    contents = _contents_pages(pages, body_size)
+
+    segments = []
+    chapter: Optional[str] = None
+    section: Optional[str] = None
+    subsection: Optional[str] = None
+    in_back_matter = False
+
+    for page_num, lines in enumerate(pages):
+        if page_num in contents:
+            continue
+
+        page_body_size = min(_body_font_size([lines]), body_size)
+        footnotes = _footnote_lines(lines, page_body_size)
+        current = None
+
+        for index, line in enumerate(lines):
+            # Amendment footnotes are left out of the chunks and must not be
+            # read as section numbers
+            if index in footnotes:
+                continue
+
+            text = line["match_text"]
+            starts_segment = current is None
+            is_heading = False
+
+            chapter_match = CHAPTER_PATTERN.match(text)
+            section_match = SECTION_PATTERN.match(text)
+            subsection_match = SUBSECTION_PATTERN.match(text)
+
+            if chapter_match:
+                chapter, section, subsection = chapter_match.group(1), None, None
+                in_back_matter = False
+                starts_segment = is_heading = True
+            elif BACK_MATTER_PATTERN.match(line["text"]):
+                # Numbered paragraphs in schedules are not sections of the Act
+                chapter, section, subsection = None, None, None
+                in_back_matter = True
+                starts_segment = is_heading = True
+            elif in_back_matter:
+                if _is_layout_heading(line, body_size):
+                    starts_segment = is_heading = True
+                elif current is not None and current["heading"]:
+                    starts_segment = True
+            elif section_match and _is_section_heading(line, page_body_size):
+                inline_match = INLINE_SUBSECTION_PATTERN.search(text)
+                section = section_match.group(1)
+                subsection = inline_match.group(1) if inline_match else None
+                starts_segment = True
+            elif subsection_match:
+                subsection = subsection_match.group(1)
+                starts_segment = True
+            elif _is_layout_heading(line, body_size):
+                starts_segment = is_heading = True
+            elif current is not None and current["heading"]:
+                # Body text after a heading (e.g. the preamble) is not part of it
+                starts_segment = True
+
+            if starts_segment:
+                current = {
+                    "page": page_num,
+                    "chapter": chapter,
+                    "section": section,
+                    "subsection": subsection,
+                    "heading": is_heading,
+                    "lines": [],
+                }
+                segments.append(current)
+
+            current["lines"].append(line["text"])
+
+    for segment in segments:
+        segment["text"] = " ".join(segment.pop("lines"))
+    return segments
+
+
+def _section_id(section: Optional[str], subsection: Optional[str]) -> str:
+    if section is None:
+        return ""
+    return f"{section}({subsection})" if subsection else section
+
+
+# Pack consecutive segments of the same section on the same page up to the token budget
+def _pack_segments(segments: List[dict]) -> List[dict]:
+    chunks = []
+    current = None
+
+    for segment in segments:
+        tokens = count_tokens(segment["text"])
+
+        # Only a heading-only chunk may take on the section that follows it
+        adopts_section = current is not None and current["heading"] and current["section"] is None
+
+        can_merge = (
+            current is not None
+            and current["page"] == segment["page"]
+            and (current["section"] == segment["section"] or adopts_section)
+            and (current["heading"] or not segment["heading"])
+            and current["tokens"] + tokens <= MAX_CHUNK_TOKENS
+        )
+
+        if can_merge:
+            if adopts_section:
+                current.update(
+                    chapter=segment["chapter"],
+                    section=segment["section"],
+                    subsection=segment["subsection"],
+                )
+            elif current["subsection"] != segment["subsection"]:
+                # Spans several sub-sections, so only the section is accurate
+                current["subsection"] = None
+
+            current["heading"] = current["heading"] and segment["heading"]
+            current["text"] += " " + segment["text"]
+            current["tokens"] += tokens
+        else:
+            current = dict(segment, tokens=tokens)
+            chunks.append(current)
+
+    return chunks
+
+
+# Chunk a PDF by its section structure, sized in embedding-model tokens.
+# Chunks never cross a page so citations keep an exact page for highlighting.
+def chunk_pdf(file_path: Path) -> List[Document]:
+    with fitz.open(file_path) as doc:
+        segments = _segment_document(doc)
+
+    documents = []
+    for chunk in _pack_segments(segments):
+        metadata = {
+            "source": file_path.name,
+            "page": chunk["page"],
+            "chapter": chunk["chapter"] or "",
+            "section": chunk["section"] or "",
+            "section_id": _section_id(chunk["section"], chunk["subsection"]),
+        }
+
+        if chunk["tokens"] > MAX_CHUNK_TOKENS:
+            texts = oversize_splitter.split_text(chunk["text"])
+        else:
+            texts = [chunk["text"]]
+
+        documents.extend(Document(page_content=text, metadata=dict(metadata)) for text in texts)
+
+    return documents
@@ -5,10 +5,10 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 
-from schemas import QueryRequest, QueryResponse, HighlightRequest
-from pdf_highlighter import highlight_pages, DATA_FOLDER
+from schemas import QueryRequest, QueryResponse, HighlightRequest, PagePreviewRequest
+from pdf_highlighter import highlight_pages, render_highlighted_page, DATA_FOLDER
+from page_cache import cache_path, get_cached, put_cached
 
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
@@ -16,6 +16,7 @@ from langchain_classic.chains.combine_documents import create_stuff_documents_ch
 from langchain_classic.chains import create_retrieval_chain
 
 from web_scraper import scrape_with_brightdata
+from processor import build_vector_store, index_is_current, embeddings, INDEX_FOLDER
 
 # App and env setup
 load_dotenv()
@@ -30,9 +31,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load the embeddings and FAISS vector DB
-embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-vector_db = FAISS.load_local("faiss_index", embeddings, allow_dangerous_deserialization=True)
+# Load the FAISS vector DB, rebuilding it if it was made by an older chunker
+if index_is_current():
+    vector_db = FAISS.load_local(str(INDEX_FOLDER), embeddings, allow_dangerous_deserialization=True)
+else:
+    vector_db = build_vector_store()
 
 # Initialise LLM
 llm = ChatGroq(
@@ -191,6 +194,62 @@ def generate_highlighted_pdf(request: HighlightRequest):
             }
         )
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+# Render a highlighted citation page to an image for inline previews
+@app.post("/highlight/page")
+def generate_page_preview(request: PagePreviewRequest):
+    # Validate snippets list is not empty
+    if not request.snippets:
+        raise HTTPException(
+            status_code=400,
+            detail="Snippets list cannot be empty"
+        )
+
+    # Validate PDF exists
+    pdf_path = DATA_FOLDER / request.pdf_name
+
+    if not pdf_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"PDF '{request.pdf_name}' not found at {pdf_path}"
+        )
+
+    try:
+        # Serve from the disk cache when this page and highlight were rendered before
+        image_path = cache_path(
+            request.pdf_name,
+            request.page,
+            request.snippets,
+            request.dpi,
+            request.image_format
+        )
+        image_bytes = get_cached(image_path)
+
+        if image_bytes is None:
+            image_bytes = render_highlighted_page(
+                source_pdf=request.pdf_name,
+                page_num=request.page,
+                snippets=request.snippets,
+                dpi=request.dpi,
+                image_format=request.image_format
+            )
+            put_cached(image_path, image_bytes)
+
+        return Response(
+            content=image_bytes,
+            media_type=f"image/{request.image_format}"
+        )
+
     except ValueError as e:
         raise HTTPException(
             status_code=400,
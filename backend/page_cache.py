@@ -0,0 +1,70 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from pdf_highlighter import DATA_FOLDER
+
+CACHE_FOLDER = Path("page_cache")
+
+# Least recently used renders are evicted beyond this many files
+MAX_CACHE_ENTRIES = 256
+
+_lock = threading.Lock()
+
+
+# Hash of the highlighted text, independent of whitespace and snippet order
+def _highlight_hash(snippets: List[str]) -> str:
+    normalised = sorted(" ".join(snip.split()) for snip in snippets)
+    return hashlib.sha256("\n".join(normalised).encode("utf-8")).hexdigest()[:16]
+
+
+# Cache file for a (pdf, page, highlight) render. The PDF's modification time
+# is part of the key so a replaced PDF never serves stale images.
+def cache_path(pdf_name: str, page_num: int, snippets: List[str], dpi: int, image_format: str) -> Path:
+    mtime = (DATA_FOLDER / pdf_name).stat().st_mtime_ns
+    stem = Path(pdf_name).stem
+    return CACHE_FOLDER / f"{stem}_{mtime}_p{page_num}_{dpi}dpi_{_highlight_hash(snippets)}.{image_format}"
+
+
+def get_cached(path: Path) -> Optional[bytes]:
+    try:
+        content = path.read_bytes()
+
+        # Touch the file so eviction sees it as recently used
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+
+    return content
+
+
+def put_cached(path: Path, content: bytes) -> None:
+    CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file first so readers never see a partial image. The name
+    # must be unique across threads and uvicorn worker processes.
+    with tempfile.NamedTemporaryFile(dir=CACHE_FOLDER, suffix=".tmp", delete=False) as tmp:
+        tmp.write(content)
+    os.replace(tmp.name, path)
+
+    with _lock:
+        _evict()
+
+
+def _evict() -> None:
+    entries = [p for p in CACHE_FOLDER.iterdir() if p.suffix != ".tmp"]
+    if len(entries) <= MAX_CACHE_ENTRIES:
+        return
+
+    def mtime(p: Path) -> float:
+        try:
+            return p.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    entries.sort(key=mtime)
+    for p in entries[:len(entries) - MAX_CACHE_ENTRIES]:
+        p.unlink(missing_ok=True)
@@ -69,4 +69,24 @@ def highlight_pages(source_pdf: str, citations: List[dict]) -> bytes:
         if not pages_added:
             raise ValueError("No valid citations found")
 
-        return output_doc.tobytes()
\ No newline at end of file
+        return output_doc.tobytes()
+
+# Render a single page with its citations highlighted to an image
+def render_highlighted_page(source_pdf: str, page_num: int, snippets: List[str], dpi: int, image_format: str) -> bytes:
+    input_path = DATA_FOLDER / source_pdf
+
+    with fitz.open(input_path) as doc:
+        if not 1 <= page_num <= len(doc):
+            raise ValueError(f"Page {page_num} is out of range")
+
+        page = doc[page_num - 1]
+        results = [highlight_snippet_on_page(page, snip) for snip in snippets]
+        if not any(results):
+            raise ValueError("No valid citations found")
+
+        pixmap = page.get_pixmap(dpi=dpi, annots=True)
+
+        # PyMuPDF has no native WebP writer, so it goes through Pillow
+        if image_format == "webp":
+            return pixmap.pil_tobytes(format="WEBP")
+        return pixmap.tobytes("png")
@@ -1,11 +1,19 @@
 import os
 from pathlib import Path
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 
-embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+from chunker import chunk_pdf, EMBEDDING_MODEL, CHUNKER_VERSION
+
+INDEX_FOLDER = Path("faiss_index")
+VERSION_FILE = INDEX_FOLDER / "chunker_version.txt"
+
+embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+
+# Check whether the saved index was built by the current chunker
+def index_is_current() -> bool:
+    return VERSION_FILE.exists() and VERSION_FILE.read_text().strip() == CHUNKER_VERSION
+
 
 def build_vector_store():
     data_path = Path('data/')
@@ -14,24 +22,15 @@ def build_vector_store():
     for file in os.listdir(data_path):
         if file.endswith(".pdf"):
             file_path = data_path / file
-            loader = PyPDFLoader(str(file_path))
-            docs = loader.load()
-
-            # Update metadata to store only filename
-            for doc in docs:
-                doc.metadata["source"] = file
-            
-            # Text chunking
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=800,
-                chunk_overlap=100
-            )
-            chunks = text_splitter.split_documents(docs)
+
+            # Section-aware chunking sized in embedding tokens
+            chunks = chunk_pdf(file_path)
             all_chunks.extend(chunks)
     
     # Save to FAISS
     vector_db = FAISS.from_documents(all_chunks, embeddings)
-    vector_db.save_local("faiss_index")
+    vector_db.save_local(str(INDEX_FOLDER))
+    VERSION_FILE.write_text(CHUNKER_VERSION)
     print(f"Indexed {len(all_chunks)} chunks from PDFs")
     return vector_db
 
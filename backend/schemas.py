@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Literal
 
 # User's question
 class QueryRequest(BaseModel):
@@ -24,4 +24,12 @@ class CitationItem(BaseModel):
 # Request to generate the highlighted PDF
 class HighlightRequest(BaseModel):
     pdf_name: str
-    citations: List[CitationItem]
\ No newline at end of file
+    citations: List[CitationItem]
+
+# Request to render a highlighted citation page as an image
+class PagePreviewRequest(BaseModel):
+    pdf_name: str
+    page: int = Field(ge=1)
+    snippets: List[str]
+    dpi: int = Field(110, ge=36, le=300)
+    image_format: Literal["png", "webp"] = "png"
\ No newline at end of file
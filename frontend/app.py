@@ -1,14 +1,15 @@
 import os
 import streamlit as st
 import requests
-import base64
-from typing import Optional, List, Dict
+from typing import List, Dict
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # Configurations
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+PREVIEW_DPI = 110
+PREVIEW_FORMAT = "webp"
 
 
 # API Functions
@@ -41,52 +42,22 @@ def ask_backend(question: str) -> Dict[str, any]:
             "citations": []
         }
 
-# Fetch highlighted PDF from backend
-def fetch_highlighted_pdf(citations: List[Dict]) -> Optional[bytes]:
-    if not citations:
-        st.error("No citations to highlight")
-        return None
-        
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/highlight",
-            json={
-                "pdf_name": citations[0]["source"],
-                "citations": [
-                    {
-                        "page": c["page"],
-                        "snippet": c["snippet"]
-                    }
-                    for c in citations
-                ]
-            },
-
-        )
-
-        if response.status_code != 200:
-            st.error("Failed to generate highlighted PDF")
-            return None
-
-        return response.content
-
-    except Exception:
-        st.error("Backend not reachable")
-        return None
-
-# Display PDF inline
-def show_pdf_inline(pdf_bytes: bytes) -> None:
-    base64_pdf = base64.b64encode(pdf_bytes).decode("utf-8")
-
-    pdf_display = f"""
-        <iframe
-            src="data:application/pdf;base64,{base64_pdf}"
-            width="100%"
-            height="600px"
-            style="border: none;"
-        ></iframe>
-    """
-
-    st.markdown(pdf_display, unsafe_allow_html=True)
+# Fetch highlighted citation page preview from backend.
+# Failures raise instead of returning None so that they are not cached.
+@st.cache_data(ttl=300, show_spinner=False)  # Avoid re-fetching on every rerun
+def fetch_citation_preview(citation: Dict) -> bytes:
+    response = requests.post(
+        f"{API_BASE_URL}/highlight/page",
+        json={
+            "pdf_name": citation["source"],
+            "page": citation["page"],
+            "snippets": [citation["snippet"]],
+            "dpi": PREVIEW_DPI,
+            "image_format": PREVIEW_FORMAT
+        },
+    )
+    response.raise_for_status()
+    return response.content
 
 # Page Configuration
 st.set_page_config(
@@ -253,10 +224,14 @@ for idx, message_data in enumerate(st.session_state.messages):
             if content.get("citations"):
                 with st.expander("Evidence"):
                     if st.button("View citation", key=f"btn_{idx}"):
-                        with st.spinner("Generating highlighted PDF..."):
-                            pdf_bytes = fetch_highlighted_pdf([content["citations"][0]])
-                            if pdf_bytes:
-                                show_pdf_inline(pdf_bytes)
+                        try:
+                            with st.spinner("Rendering highlighted page..."):
+                                image_bytes = fetch_citation_preview(content["citations"][0])
+                            st.image(image_bytes, width="stretch")
+                        except requests.HTTPError:
+                            st.error("Failed to render highlighted page")
+                        except requests.RequestException:
+                            st.error("Backend not reachable")
                     
                     citation = content["citations"][0]
                     st.markdown(f"**Source:** {citation['source']} | **Page:** {citation['page']}")